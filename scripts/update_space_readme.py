@@ -1,6 +1,22 @@
 import requests
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses JSON noticeably faster than the standard library (the APOD response
+# carries a long explanation). It is installed by the workflow; if it is missing
+# locally we quietly fall back to the built-in json module.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # --- API Endpoints ---
 # These are the URLs for the APIs we'll be fetching data from.
@@ -8,6 +24,87 @@ APOD_API_URL = "https://api.nasa.gov/planetary/apod"
 PEOPLE_IN_SPACE_API_URL = "http://api.open-notify.org/astros.json"
 ISS_LOCATION_API_URL = "http://api.open-notify.org/iss-now.json"
 
+# How every timestamp in the README is displayed.
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+# --- Markdown Templates ---
+# The static layout of each README section, filled in with str.format().
+# Defining them once here keeps the section functions focused on the data.
+APOD_TEMPLATE = """
+### Astronomy Picture of the Day (APOD)
+
+![{title}]({image_url})
+**Title:** {title}
+**Date:** {date}
+
+{explanation}
+{stale_note}"""
+
+APOD_UNAVAILABLE = """
+### Astronomy Picture of the Day (APOD)
+
+Could not retrieve today's Astronomy Picture of the Day. Please check back later!
+"""
+
+PEOPLE_IN_SPACE_TEMPLATE = """
+### 👨‍🚀 Humans Among the Stars
+
+There are currently **{number}** people in space!
+
+**Onboard:**
+{people_list}{stale_note}
+"""
+
+PEOPLE_IN_SPACE_UNAVAILABLE = """
+### 👨‍🚀 Humans Among the Stars
+
+Could not retrieve data on people in space. Please check back later!
+"""
+
+ISS_LOCATION_TEMPLATE = """
+### 🛰️ Where is the ISS Right Now?
+
+The International Space Station is currently located at:
+* **Latitude:** `{latitude}`
+* **Longitude:** `{longitude}`
+*(As of {timestamp})*
+
+*(Note: Coordinates update hourly. For a live map, you can visit [Where The ISS At?](http://wheretheiss.at/))*
+{stale_note}"""
+
+ISS_LOCATION_UNAVAILABLE = """
+### 🛰️ Where is the ISS Right Now?
+
+Could not retrieve ISS location data. Please check back later!
+"""
+
+# The README is written piece by piece: the header, each section separated by a
+# horizontal rule, and finally the "Last updated" footer.
+README_HEADER = "# ✨ Welcome to my GitHub profile! Here are some fascinating insights from the cosmos. ✨\n\n"
+SECTION_SEPARATOR = "\n\n---\n\n"
+README_FOOTER_TEMPLATE = "*Last updated: {updated_at}*"
+
+# --- Local Cache ---
+# Responses are cached on disk in the repository root (.cache/), which the workflow
+# persists between runs with actions/cache. This lets same-day runs skip the network.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '.cache')
+
+# How long (in seconds) a cached response counts as fresh before we ask the API again.
+# If a refresh fails, the last good response is still used (see cached_or_fetch).
+PEOPLE_IN_SPACE_CACHE_TTL = 6 * 60 * 60  # Crew changes are rare.
+ISS_LOCATION_CACHE_TTL = 5 * 60          # The ISS moves constantly.
+
+# The ISS section is only re-rendered once the station has moved at least this far
+# (latitude + longitude difference, in degrees) since the last rendered section, or
+# once that section is older than ISS_SECTION_MAX_AGE seconds. Together with the
+# unchanged-README check this avoids commits that only nudge the coordinates.
+ISS_MIN_MOVEMENT_DEGREES = 1.0
+ISS_SECTION_MAX_AGE = 24 * 60 * 60
+
+# HD APOD images can be many megabytes, which makes the profile slow to render.
+# Above this size (in bytes) the README embeds the standard-resolution image instead.
+MAX_APOD_IMAGE_BYTES = 5_000_000
+
 # --- Configuration for NASA API Key ---
 # We retrieve the NASA API Key from environment variables.
 # When running on GitHub Actions, it will get this from the GitHub Secret.
@@ -15,36 +112,95 @@ ISS_LOCATION_API_URL = "http://api.open-notify.org/iss-now.json"
 NASA_API_KEY = os.getenv('NASA_API_KEY')
 
 # Basic check to ensure the API key is present.
-# If not found, it prints an error and exits, preventing script failure on deployment.
-if not NASA_API_KEY:
+# If not found, it prints an error and the APOD section shows a placeholder,
+# while the People in Space and ISS sections (which need no key) still update.
+NASA_API_KEY_MISSING = not NASA_API_KEY
+if NASA_API_KEY_MISSING:
     print("ERROR: NASA_API_KEY environment variable not found.")
     print("Please ensure it's set as a GitHub Secret (NASA_API_KEY) in your repository settings.")
     print("For local testing, set it in your terminal: export NASA_API_KEY='YOUR_KEY'")
-    exit(1) # Exits the script with an error code
 
-def fetch_api_data(url, params=None, timeout=15):
+# --- Retry Policy ---
+# Transient failures (dropped connections, rate limits, 5xx errors) are retried
+# with exponential backoff before we give up and fall back to cached data.
+# With a backoff factor of 0.5 the waits between attempts grow as 0.5s, 1s, 2s...
+# Requests that succeed on the first try are not slowed down at all.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# --- Shared HTTP Session ---
+# A single Session keeps connections to each API host alive between requests,
+# so we don't pay for a new TCP (and TLS) handshake on every call.
+SESSION = requests.Session()
+http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET"],
+        # raise_on_status=False hands the last failed response back to us, so
+        # fetch_api_data still reports it through its usual HTTPError branch.
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("http://", http_adapter)
+SESSION.mount("https://", http_adapter)
+
+# Returned by fetch_api_data when the server answers 304 Not Modified,
+# meaning the copy we already have cached is still current.
+NOT_MODIFIED = object()
+
+def fetch_api_data(url, params=None, timeout=(3, 12), validators=None):
     """
     Generic function to safely fetch JSON data from a given URL.
     Includes error handling for network issues and bad HTTP responses.
     Args:
         url (str): The API endpoint URL.
         params (dict, optional): Dictionary of query parameters. Defaults to None.
-        timeout (int): Seconds to wait for a response before timing out.
+        timeout (tuple or float): (connect, read) seconds to wait before timing out,
+            or a single number for both. A short connect timeout fails fast on
+            unreachable hosts, while the longer read timeout gives a slow but
+            healthy server time to respond.
+        validators (dict, optional): The "etag" and "last_modified" values of a cached
+            response. They are sent as a conditional request, and the dict is updated
+            in place with the validators of the new response. Defaults to None.
     Returns:
-        dict or None: The JSON response data if successful, None otherwise.
+        dict or None: The JSON response data if successful, NOT_MODIFIED if the cached
+            response is still current, None otherwise.
     """
+    headers = {}
+    if validators is not None:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
         # Send a GET request to the specified URL with parameters and a timeout.
-        response = requests.get(url, params=params, timeout=timeout)
+        response = SESSION.get(url, params=params, timeout=timeout, headers=headers)
+
+        # 304 Not Modified has no body: the cached copy is still the latest one.
+        if response.status_code == 304:
+            return NOT_MODIFIED
         
         # Raise an HTTPError for bad responses (4xx or 5xx status codes).
         # This makes error handling cleaner.
         response.raise_for_status() 
+
+        if validators is not None:
+            validators["etag"] = response.headers.get("ETag")
+            validators["last_modified"] = response.headers.get("Last-Modified")
         
         # Return the JSON parsed response.
-        return response.json()
+        return json_loads(response.content)
     except requests.exceptions.Timeout:
-        print(f"ERROR: Request to {url} timed out after {timeout} seconds.")
+        if isinstance(timeout, tuple):
+            print(f"ERROR: Request to {url} timed out (connect {timeout[0]}s / read {timeout[1]}s).")
+        else:
+            print(f"ERROR: Request to {url} timed out after {timeout} seconds.")
         return None
     except requests.exceptions.ConnectionError:
         print(f"ERROR: Could not connect to {url}. Check internet connection or API availability.")
@@ -56,27 +212,184 @@ def fetch_api_data(url, params=None, timeout=15):
         # Catch any other requests-related errors
         print(f"ERROR: An unexpected error occurred while fetching data from {url}: {e}")
         return None
-    except ValueError: # JSONDecodeError inherits from ValueError
+    except ValueError: # json's and orjson's JSONDecodeError both inherit from ValueError
         print(f"ERROR: Failed to decode JSON from response from {url}.")
         return None
 
-def get_apod_content():
+def read_cache(cache_path):
+    """
+    Loads previously cached JSON data from disk.
+    Args:
+        cache_path (str): Path to the cache file.
+    Returns:
+        dict or None: The cached data, or None if it is missing or unreadable.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"WARNING: Ignoring unreadable cache file {cache_path}: {e}")
+        return None
+
+def write_cache(cache_path, data):
+    """
+    Saves JSON data to disk so later runs can reuse it.
+    A failure to write the cache is reported but never stops the README update.
+    Args:
+        cache_path (str): Path to the cache file.
+        data (dict): The JSON-serializable data to store.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except (OSError, TypeError) as e:
+        print(f"WARNING: Could not write cache file {cache_path}: {e}")
+
+def cached_or_fetch(url, cache_path, ttl, now, params=None, is_fresh=None):
+    """
+    Returns API data from the on-disk cache when it is fresh, otherwise fetches it.
+    Implements stale-while-revalidate: successful fetches are written through to the
+    cache, and if a fetch fails the last cached response is returned instead.
+    Stale entries are revalidated with ETag/Last-Modified, so an unchanged response
+    costs a bodyless 304 rather than a full download.
+    Args:
+        url (str): The API endpoint URL.
+        cache_path (str): Path to the cache file for this endpoint.
+        ttl (float): Seconds a cached response stays fresh.
+        now (datetime): The current UTC time for this run.
+        params (dict, optional): Dictionary of query parameters. Defaults to None.
+        is_fresh (callable, optional): Decides from the cached data itself whether it
+            is still fresh, instead of its age. Defaults to None (use ttl).
+    Returns:
+        tuple: (data, stale_as_of). data is the JSON response (or None if nothing is
+            available); stale_as_of is a UTC time string when stale cached data is
+            returned, None otherwise.
+    """
+    cached = read_cache(cache_path)
+    if not isinstance(cached, dict) or "data" not in cached or "fetched_at" not in cached:
+        cached = None
+
+    if cached and (is_fresh(cached["data"]) if is_fresh else now.timestamp() - cached["fetched_at"] < ttl):
+        print(f"Using cached data for {url}")
+        return cached["data"], None
+
+    # Ask the API to skip the body if our cached copy is still current.
+    validators = {}
+    if cached:
+        validators = {"etag": cached.get("etag"), "last_modified": cached.get("last_modified")}
+
+    data = fetch_api_data(url, params=params, validators=validators)
+    if data is NOT_MODIFIED:
+        data = cached["data"]
+    if data:
+        write_cache(cache_path, {"fetched_at": now.timestamp(), "data": data, **validators})
+        return data, None
+
+    if cached:
+        as_of = datetime.fromtimestamp(cached["fetched_at"], tz=timezone.utc).strftime(TIMESTAMP_FORMAT)
+        print(f"Falling back to cached data for {url} (as of {as_of})")
+        return cached["data"], as_of
+
+    return None, None
+
+def stale_note(stale_as_of):
+    """
+    Builds the note shown under a section rendered from stale cached data.
+    Args:
+        stale_as_of (str or None): When the cached data was fetched.
+    Returns:
+        str: A Markdown note, or an empty string if the data is fresh.
+    """
+    if not stale_as_of:
+        return ""
+    return f"\n*(Live data is currently unavailable; showing data as of {stale_as_of}.)*\n"
+
+def get_image_info(image_url):
+    """
+    Checks an image URL with a HEAD request, which only transfers the headers.
+    The result is cached per URL, since an APOD image does not change once published
+    (transient 5xx/429 replies are not cached).
+    Args:
+        image_url (str): The image URL to check.
+    Returns:
+        dict or None: {"url", "status", "size"} where size is the Content-Length in
+            bytes (or None if not reported), or None if the check itself failed.
+    """
+    cache_path = os.path.join(CACHE_DIR, "apod-image.json")
+    cached = read_cache(cache_path)
+    if isinstance(cached, dict) and cached.get("url") == image_url:
+        return cached
+
+    try:
+        response = SESSION.head(image_url, timeout=5, allow_redirects=True)
+    except requests.exceptions.RequestException as e:
+        print(f"WARNING: Could not check image {image_url}: {e}")
+        return None
+
+    try:
+        size = int(response.headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        size = None
+    info = {"url": image_url, "status": response.status_code, "size": size}
+    # Server errors and rate limits are transient: use them for this run only.
+    if response.status_code < 500 and response.status_code != 429:
+        write_cache(cache_path, info)
+    return info
+
+# Today's APOD data, kept in memory as {date_str: data} so that repeated calls in
+# the same process (e.g. when this module is imported as a library) only fetch once.
+APOD_MEMO = {}
+
+def get_apod_data(date_str, now):
+    """
+    Fetches the APOD data for a UTC date, at most once per process.
+    Only fresh, successful results are memoized, so a failed fetch or stale
+    fallback is retried on the next call.
+    Args:
+        date_str (str): The UTC date in ISO format (e.g. '2025-07-24').
+        now (datetime): The current UTC time for this run.
+    Returns:
+        tuple: (data, stale_as_of), as returned by cached_or_fetch.
+    """
+    if date_str in APOD_MEMO:
+        return APOD_MEMO[date_str], None
+
+    print("Fetching APOD data...")
+    # NASA publishes the new picture around US-Eastern midnight (~04:00-05:00 UTC),
+    # so a cached response only counts as fresh once it is the picture for date_str.
+    # Until then every run revalidates it, which the ETag keeps cheap.
+    def is_todays_picture(data):
+        return data.get("date") == date_str
+
+    params = {"api_key": NASA_API_KEY}
+    data, stale_as_of = cached_or_fetch(APOD_API_URL, os.path.join(CACHE_DIR, "apod.json"), ttl=None, now=now,
+                                        params=params, is_fresh=is_todays_picture)
+    if data and not stale_as_of and is_todays_picture(data):
+        # Only today's entry is ever needed, so older dates are dropped.
+        APOD_MEMO.clear()
+        APOD_MEMO[date_str] = data
+    return data, stale_as_of
+
+def get_apod_content(now):
     """
     Fetches and formats Astronomy Picture of the Day data.
     Handles both image and video APODs.
+    Args:
+        now (datetime): The current UTC time for this run.
     Returns:
         str: Markdown formatted string for the APOD section.
     """
-    print("Fetching APOD data...")
-    params = {"api_key": NASA_API_KEY}
-    data = fetch_api_data(APOD_API_URL, params=params)
+    if NASA_API_KEY_MISSING:
+        print("Skipping APOD data: NASA_API_KEY is not set.")
+        return APOD_UNAVAILABLE
+
+    data, stale_as_of = get_apod_data(now.date().isoformat(), now)
     
     if not data:
-        return """
-### Astronomy Picture of the Day (APOD)
-
-Could not retrieve today's Astronomy Picture of the Day. Please check back later!
-"""
+        return APOD_UNAVAILABLE
 
     title = data.get("title", "No Title Available")
     explanation = data.get("explanation", "No explanation available.")
@@ -95,34 +408,31 @@ Could not retrieve today's Astronomy Picture of the Day. Please check back later
         # Prefer HD image if available, otherwise use the regular URL.
         image_url = data.get("hdurl", data.get("url", image_url))
         explanation_formatted = explanation
+
+        # Fall back to the regular URL if the HD image is missing or too large to embed.
+        if data.get("url") and image_url != data["url"]:
+            image_info = get_image_info(image_url)
+            if image_info and (image_info["status"] >= 400 or (image_info["size"] or 0) > MAX_APOD_IMAGE_BYTES):
+                image_url = data["url"]
     
     # Construct the Markdown string for the APOD section
-    content = f"""
-### Astronomy Picture of the Day (APOD)
-
-![{title}]({image_url})
-**Title:** {title}
-**Date:** {date}
-
-{explanation_formatted}
-"""
-    return content
+    return APOD_TEMPLATE.format(title=title, image_url=image_url, date=date,
+                                explanation=explanation_formatted, stale_note=stale_note(stale_as_of))
 
-def get_people_in_space_content():
+def get_people_in_space_content(now):
     """
     Fetches data on people currently in space and formats it for Markdown.
+    Args:
+        now (datetime): The current UTC time for this run.
     Returns:
         str: Markdown formatted string for the People in Space section.
     """
     print("Fetching People in Space data...")
-    data = fetch_api_data(PEOPLE_IN_SPACE_API_URL)
+    data, stale_as_of = cached_or_fetch(PEOPLE_IN_SPACE_API_URL, os.path.join(CACHE_DIR, "people.json"),
+                                        ttl=PEOPLE_IN_SPACE_CACHE_TTL, now=now)
 
     if not data:
-        return """
-### 👨‍🚀 Humans Among the Stars
-
-Could not retrieve data on people in space. Please check back later!
-"""
+        return PEOPLE_IN_SPACE_UNAVAILABLE
 
     number = data.get("number", 0)
     people = data.get("people", [])
@@ -134,35 +444,47 @@ Could not retrieve data on people in space. Please check back later!
     else:
         people_list_md = "* No specific names available at this time.\n"
 
-    content = f"""
-### 👨‍🚀 Humans Among the Stars
-
-There are currently **{number}** people in space!
-
-**Onboard:**
-{people_list_md}
-"""
-    return content
+    return PEOPLE_IN_SPACE_TEMPLATE.format(number=number, people_list=people_list_md,
+                                           stale_note=stale_note(stale_as_of))
 
-def get_iss_location_content():
+def get_iss_location_content(now):
     """
     Fetches the current ISS location data and formats it for Markdown.
+    Args:
+        now (datetime): The current UTC time for this run.
     Returns:
         str: Markdown formatted string for the ISS Location section.
     """
     print("Fetching ISS Location data...")
-    data = fetch_api_data(ISS_LOCATION_API_URL)
+    data, stale_as_of = cached_or_fetch(ISS_LOCATION_API_URL, os.path.join(CACHE_DIR, "iss.json"),
+                                        ttl=ISS_LOCATION_CACHE_TTL, now=now)
 
     if not data:
-        return """
-### 🛰️ Where is the ISS Right Now?
-
-Could not retrieve ISS location data. Please check back later!
-"""
+        return ISS_LOCATION_UNAVAILABLE
 
     iss_position = data.get("iss_position", {})
     latitude = iss_position.get("latitude", "N/A")
     longitude = iss_position.get("longitude", "N/A")
+
+    # Reuse the last rendered section verbatim if the ISS has barely moved since.
+    section_cache_path = os.path.join(CACHE_DIR, "iss-section.json")
+    try:
+        position = (float(latitude), float(longitude))
+    except (TypeError, ValueError):
+        position = None
+    if position and not stale_as_of:
+        cached_section = read_cache(section_cache_path)
+        try:
+            lat_moved = abs(position[0] - cached_section["latitude"])
+            # Longitude wraps around at +/-180 degrees.
+            lon_moved = abs(position[1] - cached_section["longitude"]) % 360
+            lon_moved = min(lon_moved, 360 - lon_moved)
+            if (lat_moved + lon_moved < ISS_MIN_MOVEMENT_DEGREES
+                    and now.timestamp() - cached_section["rendered_at"] < ISS_SECTION_MAX_AGE):
+                print("ISS has barely moved since the last update; keeping the previous section.")
+                return cached_section["content"]
+        except (TypeError, KeyError):
+            pass # No usable previous section, render a new one below.
     
     # Convert Unix timestamp (seconds since epoch) to human-readable UTC time.
     # It's important to specify timezone.utc for consistency.
@@ -170,62 +492,80 @@ Could not retrieve ISS location data. Please check back later!
     if timestamp:
         try:
             dt_object = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            iss_timestamp_utc = dt_object.strftime('%Y-%m-%d %H:%M:%S UTC')
+            iss_timestamp_utc = dt_object.strftime(TIMESTAMP_FORMAT)
         except (TypeError, ValueError):
             iss_timestamp_utc = "Invalid Timestamp"
     else:
         iss_timestamp_utc = "N/A"
 
-    content = f"""
-### 🛰️ Where is the ISS Right Now?
-
-The International Space Station is currently located at:
-* **Latitude:** `{latitude}`
-* **Longitude:** `{longitude}`
-*(As of {iss_timestamp_utc})*
-
-*(Note: Coordinates update hourly. For a live map, you can visit [Where The ISS At?](http://wheretheiss.at/))*
-"""
+    content = ISS_LOCATION_TEMPLATE.format(latitude=latitude, longitude=longitude, timestamp=iss_timestamp_utc,
+                                           stale_note=stale_note(stale_as_of))
+    if position and not stale_as_of:
+        write_cache(section_cache_path, {"rendered_at": now.timestamp(), "latitude": position[0],
+                                         "longitude": position[1], "content": content})
     return content
 
-def generate_readme_content():
+def generate_readme_content(now):
     """
-    Assembles all the fetched content into the complete README Markdown string.
-    Returns:
-        str: The full Markdown content for the README.md file.
+    Generates the complete README Markdown one piece at a time, so it can be
+    written straight to the file without first building the whole string.
+    Args:
+        now (datetime): The current UTC time for this run.
+    Yields:
+        str: Consecutive chunks of the README.md content.
     """
-    # Get the current time in UTC for the "Last updated" timestamp.
-    current_update_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
-
-    # Retrieve Markdown content for each section
-    apod_section_md = get_apod_content()
-    people_section_md = get_people_in_space_content()
-    iss_section_md = get_iss_location_content()
+    # Format the run's start time for the "Last updated" timestamp.
+    current_update_time = now.strftime(TIMESTAMP_FORMAT)
+
+    # Retrieve Markdown content for each section.
+    # NASA and open-notify.org are independent hosts, so their requests are issued
+    # concurrently and the whole fetch phase takes about as long as the slowest host.
+    # Both open-notify.org endpoints run back to back on the same worker, so the
+    # second request reuses the first one's keep-alive connection instead of
+    # opening another socket in parallel.
+    # Worker threads are cheap next to the network round-trips, and they let us
+    # keep using `requests` instead of pulling in an async HTTP client for three calls.
+    def get_open_notify_sections():
+        return [get_people_in_space_content(now), get_iss_location_content(now)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        apod_future = executor.submit(get_apod_content, now)
+        open_notify_future = executor.submit(get_open_notify_sections)
+
+        yield README_HEADER
+        # Sections are yielded in page order: APOD as soon as it is ready,
+        # then both open-notify.org sections once their worker has finished.
+        yield apod_future.result()
+        yield SECTION_SEPARATOR
+        for section in open_notify_future.result():
+            yield section
+            yield SECTION_SEPARATOR
 
     # Get the repository name from GitHub Actions environment variable
     # This makes the "open-source" link dynamic and correct for your repo.
     # GITHUB_REPOSITORY is automatically set by GitHub Actions (e.g., 'your-username/your-username').
     repo_name = os.getenv('GITHUB_REPOSITORY', 'YOUR_USERNAME/YOUR_USERNAME') 
 
-    # Assemble the full README content using an f-string for easy insertion
-    readme_template = f"""
-# ✨ Welcome to my GitHub profile! Here are some fascinating insights from the cosmos. ✨
-
-{apod_section_md}
-
----
-
-{people_section_md}
-
----
+    yield README_FOOTER_TEMPLATE.format(updated_at=current_update_time)
 
-{iss_section_md}
-
----
-
-*Last updated: {current_update_time}*
-"""
-    return readme_template.strip() # .strip() removes leading/trailing whitespace
+def readme_digest(path):
+    """
+    Hashes a README file, ignoring the "Last updated" footer.
+    The footer changes on every run, so leaving it out lets us tell whether the
+    actual content changed.
+    Args:
+        path (str): Path to the README file.
+    Returns:
+        bytes or None: The SHA-256 digest, or None if the file does not exist.
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    footer_prefix = README_FOOTER_TEMPLATE.split("{", 1)[0].encode("utf-8")
+    body, found, _ = content.rpartition(footer_prefix)
+    return hashlib.sha256(body if found else content).digest()
 
 def update_readme_file():
     """
@@ -233,7 +573,9 @@ def update_readme_file():
     and writing the content to the README.md file.
     """
     print("Starting README update process...")
-    new_readme_content = generate_readme_content()
+    # Capture the current UTC time once, so every timestamp and cache age in
+    # this run is measured from the same instant.
+    now = datetime.now(timezone.utc)
 
     # Construct the correct path to README.md.
     # os.path.dirname(__file__) gets the directory of the current script (scripts/).
@@ -241,14 +583,35 @@ def update_readme_file():
     # 'README.md' is the target file.
     readme_path = os.path.join(os.path.dirname(__file__), '..', 'README.md')
     
+    tmp_path = None
     try:
-        # Open the README.md file in write mode ('w').
+        # Write into a temporary file next to README.md first, then swap it into place.
+        # os.replace() is atomic, so if the job is cancelled mid-write the old README
+        # stays intact instead of being left half-written (and then committed).
         # 'encoding="utf-8"' ensures proper handling of various characters (e.g., emojis).
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(new_readme_content)
+        # The content is streamed into the file as each section becomes ready.
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(readme_path),
+                                         prefix="README.md.", suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            f.writelines(generate_readme_content(now))
+        # If only the "Last updated" line differs, keep the current README so the
+        # workflow has nothing to commit and push.
+        if readme_digest(tmp_path) == readme_digest(readme_path):
+            print("No change in README.md content; leaving it untouched.")
+            return
+
+        # Temporary files are created private (0600); keep the README's usual permissions.
+        if os.path.exists(readme_path):
+            shutil.copymode(readme_path, tmp_path)
+        os.replace(tmp_path, readme_path)
+        tmp_path = None
         print(f"Successfully updated README.md at: {readme_path}")
     except Exception as e:
         print(f"ERROR: Failed to write to README.md at {readme_path}: {e}")
+    finally:
+        # Clean up the temporary file if anything went wrong before the swap.
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 # This ensures update_readme_file() runs only when the script is executed directly.
 if __name__ == "__main__":